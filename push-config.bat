@@ -1,7 +1,7 @@
 rem exclude fire 10.201.12.51
 
 
-python push-config.py --target-ip 10.201.12.11,10.201.12.18,10.201.12.22,10.201.12.24,10.201.12.27,10.201.12.30,10.201.12.32,10.201.12.34,10.201.12.36,10.201.12.38,10.201.12.40,10.201.12.42,10.201.12.44,10.201.12.45,10.201.12.47,10.201.12.49,10.201.12.52,10.201.12.54,10.201.12.58,10.201.12.60,10.201.12.66,10.201.12.67,10.201.12.68,10.201.12.69,10.201.12.70,10.201.12.71,10.201.12.72,10.201.12.73,10.201.12.74,10.201.12.75,10.201.12.76,10.201.12.77,10.201.12.12,10.201.12.13,10.201.12.14,10.201.12.15,10.201.12.16,10.201.12.17,10.201.12.19,10.201.12.20,10.201.12.21,10.201.12.23,10.201.12.25,10.201.12.26,10.201.12.28,10.201.12.29,10.201.12.31,10.201.12.33,10.201.12.35,10.201.12.37,10.201.12.39,10.201.12.41,10.201.12.43,10.201.12.46,10.201.12.50,10.201.12.53,10.201.12.55,10.201.12.56,10.201.12.57,10.201.12.59,10.201.12.61,10.201.12.62,10.201.12.63,10.201.12.64,10.201.12.65
-python reboot.py --target-ip 10.201.12.11,10.201.12.18,10.201.12.22,10.201.12.24,10.201.12.27,10.201.12.30,10.201.12.32,10.201.12.34,10.201.12.36,10.201.12.38,10.201.12.40,10.201.12.42,10.201.12.44,10.201.12.45,10.201.12.47,10.201.12.49,10.201.12.52,10.201.12.54,10.201.12.58,10.201.12.60,10.201.12.66,10.201.12.67,10.201.12.68,10.201.12.69,10.201.12.70,10.201.12.71,10.201.12.72,10.201.12.73,10.201.12.74,10.201.12.75,10.201.12.76,10.201.12.77,10.201.12.12,10.201.12.13,10.201.12.14,10.201.12.15,10.201.12.16,10.201.12.17,10.201.12.19,10.201.12.20,10.201.12.21,10.201.12.23,10.201.12.25,10.201.12.26,10.201.12.28,10.201.12.29,10.201.12.31,10.201.12.33,10.201.12.35,10.201.12.37,10.201.12.39,10.201.12.41,10.201.12.43,10.201.12.46,10.201.12.50,10.201.12.53,10.201.12.55,10.201.12.56,10.201.12.57,10.201.12.59,10.201.12.61,10.201.12.62,10.201.12.63,10.201.12.64,10.201.12.65
+python push-config.py --select "(group=stations or group=collect) and not name=WLED-117"
+python reboot.py --select "(group=stations or group=collect) and not name=WLED-117"
 
 pause
\ No newline at end of file
@@ -1,8 +1,11 @@
 import argparse
 import requests
 from zeroconf import Zeroconf, ServiceBrowser, ServiceListener
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import json
+from wled_preflight import run_preflight, get_cached_status, add_preflight_arguments
+from wled_targets import add_target_arguments, resolve_target_ips
 
 class WLEDDevice:
     def __init__(self, ip, port=80):
@@ -58,16 +61,21 @@ def configure_wled_hardware(device):
     try:
         print(f"Attempting to configure device at {target_ip}...")
         
-        # Get current device info
-        print("  → Getting device information...")
-        response = requests.get(f"http://{target_ip}/json/info", timeout=10)
-        response.raise_for_status()
-        mac_address = response.json().get("mac", "Unknown MAC address")
-        device_name = response.json().get("name", "Unknown device")
-        print(f"  → Found device: {device_name} (MAC: {mac_address})")
+        # Get current device info, reusing the pre-flight result when available
+        status = get_cached_status(target_ip)
+        if status is not None and status.reachable:
+            info = status.info
+        else:
+            print(f"  → {target_ip}: Getting device information...")
+            response = requests.get(f"http://{target_ip}/json/info", timeout=10)
+            response.raise_for_status()
+            info = response.json()
+        mac_address = info.get("mac", "Unknown MAC address")
+        device_name = info.get("name", "Unknown device")
+        print(f"  → {target_ip}: Found device: {device_name} (MAC: {mac_address})")
 
         # Send LED configuration
-        print("  → Sending LED configuration...")
+        print(f"  → {target_ip}: Sending LED configuration...")
         led_config = {
             "hw": {
                 "led": {
@@ -126,10 +134,10 @@ def configure_wled_hardware(device):
                                headers={'Content-Type': 'application/json'}, 
                                timeout=10)
         response.raise_for_status()
-        print("  → Configuration sent successfully")
+        print(f"  → {target_ip}: Configuration sent successfully")
 
         # Verify the settings were applied
-        print("  → Verifying configuration...")
+        print(f"  → {target_ip}: Verifying configuration...")
         response = requests.get(f"http://{target_ip}/json/cfg", timeout=10)
         response.raise_for_status()
         current_config = response.json()
@@ -137,19 +145,19 @@ def configure_wled_hardware(device):
         # Check if LED count was applied correctly
         led_total = current_config.get("hw", {}).get("led", {}).get("total", 0)
         if led_total == 24:
-            print(f"  → Configuration verified: LED count = {led_total}")
+            print(f"  → {target_ip}: Configuration verified: LED count = {led_total}")
         else:
-            print(f"  → Warning: Expected 24 LEDs, but device shows {led_total}")
+            print(f"  → {target_ip}: Warning: Expected 24 LEDs, but device shows {led_total}")
         
         # Restart WLED using the JSON API
-        print("  → Restarting WLED...")
+        print(f"  → {target_ip}: Restarting WLED...")
         restart_command = json.dumps({"rb": True})
         response = requests.post(f"http://{target_ip}/json/state", 
                                data=restart_command, 
                                headers={'Content-Type': 'application/json'}, 
                                timeout=5)
         response.raise_for_status()
-        print("  → Restart command sent successfully")
+        print(f"  → {target_ip}: Restart command sent successfully")
         print(f"✓ Successfully configured {target_ip} - device will reboot")
         return True
         
@@ -177,8 +185,10 @@ def configure_wled_hardware(device):
 
 def main():
     parser = argparse.ArgumentParser(description="Configure WLED LED and hardware settings.")
-    parser.add_argument('--target-ip', type=str, help='Comma separated list of target IPs (ex: 192.168.1.10,192.168.1.11)')
+    add_target_arguments(parser)
     parser.add_argument("--discover", action="store_true", help="Use mDNS discovery to find WLED devices.")
+    add_preflight_arguments(parser)
+    parser.add_argument("--workers", type=int, default=8, help="Number of devices to configure at the same time.")
     args = parser.parse_args()
 
     successful_configs = 0
@@ -191,32 +201,27 @@ def main():
             exit(1)
         if len(devices) > 0:
             devices = select_wled_device(devices)
-        
-        print(f"\nConfiguring {len(devices)} device(s)...")
-        for device in devices:
-            target_ip = device.parsed_addresses()[0]
-            device_obj = WLEDDevice(target_ip)
-            if configure_wled_hardware(device_obj):
-                successful_configs += 1
-            else:
-                failed_configs += 1
+        target_ips = [device.parsed_addresses()[0] for device in devices]
                 
-    elif args.target_ip:
-        # Handle multiple IPs entered as comma separated string
-        target_ips = [ip.strip() for ip in args.target_ip.split(',')]
-        print(f"Using target IP(s): {target_ips}")
-        print(f"\nConfiguring {len(target_ips)} device(s)...")
-        
-        for ip in target_ips:
-            device = WLEDDevice(ip)
-            if configure_wled_hardware(device):
+    else:
+        target_ips = resolve_target_ips(args)
+        if not target_ips:
+            print("Please provide --target-ip, --select or --discover option.")
+            exit(1)
+        print(f"Using {len(target_ips)} target IP(s)")
+
+    if not args.skip_preflight:
+        target_ips, excluded = run_preflight(target_ips, connect_timeout=args.preflight_timeout, min_vid=args.min_vid)
+        failed_configs += len(excluded)
+
+    print(f"\nConfiguring {len(target_ips)} device(s)...")
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(configure_wled_hardware, WLEDDevice(ip)) for ip in target_ips]
+        for future in as_completed(futures):
+            if future.result():
                 successful_configs += 1
             else:
                 failed_configs += 1
-                
-    else:
-        print("Please provide either --target-ip or --discover option.")
-        exit(1)
 
     # Print summary
     total_devices = successful_configs + failed_configs
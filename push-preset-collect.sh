@@ -2,7 +2,7 @@
 cp presets-collect.json presets.json
 
 python push-presets.py \
---target-ip 10.201.12.12,10.201.12.13,10.201.12.14,10.201.12.15,10.201.12.16,10.201.12.17,10.201.12.19,10.201.12.20,10.201.12.21,10.201.12.23,10.201.12.25,10.201.12.26,10.201.12.28,10.201.12.29,10.201.12.31,10.201.12.33,10.201.12.35,10.201.12.37,10.201.12.39,10.201.12.41,10.201.12.43,10.201.12.46,10.201.12.50,10.201.12.53,10.201.12.55,10.201.12.56,10.201.12.57,10.201.12.59,10.201.12.61,10.201.12.62,10.201.12.63,10.201.12.64,10.201.12.65 \
+--select "group=collect" \
  presets.json
 python reboot.py \
---target-ip 10.201.12.12,10.201.12.13,10.201.12.14,10.201.12.15,10.201.12.16,10.201.12.17,10.201.12.19,10.201.12.20,10.201.12.21,10.201.12.23,10.201.12.25,10.201.12.26,10.201.12.28,10.201.12.29,10.201.12.31,10.201.12.33,10.201.12.35,10.201.12.37,10.201.12.39,10.201.12.41,10.201.12.43,10.201.12.46,10.201.12.50,10.201.12.53,10.201.12.55,10.201.12.56,10.201.12.57,10.201.12.59,10.201.12.61,10.201.12.62,10.201.12.63,10.201.12.64,10.201.12.65
\ No newline at end of file
+--select "group=collect"
\ No newline at end of file
@@ -2,9 +2,9 @@
 cp presets-stations-dim.json presets.json
 
 python push-presets.py \
---target-ip 10.201.12.11,10.201.12.18,10.201.12.22,10.201.12.24,10.201.12.27,10.201.12.30,10.201.12.32,10.201.12.34,10.201.12.36,10.201.12.38,10.201.12.40,10.201.12.42,10.201.12.44,10.201.12.45,10.201.12.47,10.201.12.49,10.201.12.51,10.201.12.52,10.201.12.54,10.201.12.58,10.201.12.60,10.201.12.66,10.201.12.67,10.201.12.68,10.201.12.69,10.201.12.70,10.201.12.71,10.201.12.72,10.201.12.73,10.201.12.74,10.201.12.75,10.201.12.76,10.201.12.77 \
+--select "group=stations" \
 presets.json
 
 
 python reboot.py \
---target-ip 10.201.12.11,10.201.12.18,10.201.12.22,10.201.12.24,10.201.12.27,10.201.12.30,10.201.12.32,10.201.12.34,10.201.12.36,10.201.12.38,10.201.12.40,10.201.12.42,10.201.12.44,10.201.12.45,10.201.12.47,10.201.12.49,10.201.12.51,10.201.12.52,10.201.12.54,10.201.12.58,10.201.12.60,10.201.12.66,10.201.12.67,10.201.12.68,10.201.12.69,10.201.12.70,10.201.12.71,10.201.12.72,10.201.12.73,10.201.12.74,10.201.12.75,10.201.12.76,10.201.12.77
\ No newline at end of file
+--select "group=stations"
\ No newline at end of file
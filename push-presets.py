@@ -1,8 +1,11 @@
 import argparse
 import requests
 from zeroconf import Zeroconf, ServiceBrowser, ServiceListener
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import json
+from wled_preflight import run_preflight, add_preflight_arguments
+from wled_targets import add_target_arguments, resolve_target_ips
 
 class WLEDDevice:
     def __init__(self, ip, port=80):
@@ -86,8 +89,10 @@ def upload_presets_to_device(device, presets_file):
 
 def main():
     parser = argparse.ArgumentParser(description="Configure WLED LED and hardware settings.")
-    parser.add_argument('--target-ip', type=str, help='Comma separated list of target IPs (ex: 192.168.1.10,192.168.1.11)')
+    add_target_arguments(parser)
     parser.add_argument("--discover", action="store_true", help="Use mDNS discovery to find WLED devices.")
+    add_preflight_arguments(parser)
+    parser.add_argument("--workers", type=int, default=8, help="Number of devices to upload to at the same time.")
     parser.add_argument("presets_file", help="Path to the presets.json file")
     args = parser.parse_args()
 
@@ -101,35 +106,32 @@ def main():
             exit(1)
         if len(devices) > 0:
             devices = select_wled_device(devices)
-        
-        print(f"\nUploading presets to {len(devices)} device(s)...")
-        for device in devices:
-            device.server = device.parsed_addresses()[0]
-            device.port = device.port
-            if upload_presets_to_device(device, args.presets_file):
-                successful_uploads += 1
-            else:
-                failed_uploads += 1
+        devices = [WLEDDevice(ip=device.parsed_addresses()[0], port=device.port) for device in devices]
                 
-    elif args.target_ip:
-        # Handle multiple IPs entered as comma separated string
-        target_ips = [ip.strip() for ip in args.target_ip.split(',')]
-        print(f"Using target IP(s): {target_ips}")
-        print(f"\nUploading presets to {len(target_ips)} device(s)...")
-        
-        # For each IP provided, you can perform your operation.
-        # Example: push presets to each target IP.
-        for ip in target_ips:
-            device = WLEDDevice(ip=ip)
-            if upload_presets_to_device(device, args.presets_file):
+    else:
+        target_ips = resolve_target_ips(args)
+        if not target_ips:
+            print("Please provide --target-ip, --select or --discover option.")
+            exit(1)
+        print(f"Using {len(target_ips)} target IP(s)")
+        devices = [WLEDDevice(ip=ip) for ip in target_ips]
+
+    if not args.skip_preflight:
+        ready_ips, excluded = run_preflight([device.server for device in devices],
+                                            connect_timeout=args.preflight_timeout, min_vid=args.min_vid,
+                                            ports={device.server: device.port for device in devices})
+        devices = [device for device in devices if device.server in ready_ips]
+        failed_uploads += len(excluded)
+
+    print(f"\nUploading presets to {len(devices)} device(s)...")
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(upload_presets_to_device, device, args.presets_file) for device in devices]
+        for future in as_completed(futures):
+            if future.result():
                 successful_uploads += 1
             else:
                 failed_uploads += 1
 
-    else:
-        print("Please provide either --target-ip or --discover option.")
-        exit(1)
-
     # Print summary
     total_devices = successful_uploads + failed_uploads
     print(f"\n{'='*50}")
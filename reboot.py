@@ -4,6 +4,7 @@ from zeroconf import Zeroconf, ServiceBrowser, ServiceListener
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import json
+from wled_targets import add_target_arguments, resolve_target_ips
 
 class WLEDListener(ServiceListener):
     def __init__(self):
@@ -61,15 +62,11 @@ def send_reboot_command(target_ip):
 
 def main():
     parser = argparse.ArgumentParser(description="Send reboot command to WLED devices.")
-    parser.add_argument("--target-ip", help="Comma separated IP addresses of the WLED devices.")
+    add_target_arguments(parser)
     parser.add_argument("--discover", action="store_true", help="Use mDNS discovery to find WLED devices.")
     args = parser.parse_args()
 
-    if args.target_ip:
-        # Split and strip the IPs so we have a list
-        target_ips = [ip.strip() for ip in args.target_ip.split(',')]
-    else:
-        target_ips = []
+    target_ips = resolve_target_ips(args)
 
     if args.discover:
 
@@ -81,7 +78,7 @@ def main():
             devices = select_wled_device(devices)
             target_ips.extend(device.parsed_addresses()[0] for device in devices)
     if not target_ips:
-        print("Please provide at least one target IP address or use mDNS discovery.")
+        print("Please provide at least one target IP address, a --select expression or use mDNS discovery.")
         return
 
     with ThreadPoolExecutor() as executor:
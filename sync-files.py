@@ -0,0 +1,200 @@
+import argparse
+import hashlib
+import json
+import os
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from wled_preflight import run_preflight, get_cached_status, add_preflight_arguments
+from wled_targets import add_target_arguments, resolve_target_ips, load_inventory
+
+# Files that --delete never removes unless the manifest manages them itself.
+PROTECTED_FILES = {"/cfg.json", "/wsec.json", "/presets.json"}
+
+class LocalFile:
+    """A manifest file read once into memory and shared by every device that receives it."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self.data = file.read()
+        self.size = len(self.data)
+        self.sha256 = hashlib.sha256(self.data).hexdigest()
+
+def normalize_remote_path(path):
+    return path if path.startswith("/") else "/" + path
+
+def load_manifest(manifest_file, inventory):
+    """
+    Read the manifest and return {ip: {remote_path: LocalFile}}.
+    Each manifest key is a selector expression (ex: "group=stations") mapping local files to device paths.
+    """
+    with open(manifest_file, mode='r') as file:
+        manifest = json.load(file)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+    local_files = {}
+    plan = {}
+    for selector, files in manifest.items():
+        devices = inventory.resolve(selector)
+        print(f"Manifest '{selector}': {len(files)} file(s) for {len(devices)} device(s)")
+        for local_path, remote_path in files.items():
+            local_path = os.path.join(base_dir, local_path)
+            remote_path = normalize_remote_path(remote_path)
+            if local_path not in local_files:
+                local_files[local_path] = LocalFile(local_path)
+            local_file = local_files[local_path]
+            for device in devices:
+                entries = plan.setdefault(device.ip, {})
+                existing = entries.get(remote_path)
+                if existing is not None and existing.sha256 != local_file.sha256:
+                    raise ValueError(f"{device.name} gets different files for {remote_path}: "
+                                     f"{existing.path} and {local_file.path}")
+                entries[remote_path] = local_file
+    return plan
+
+def list_remote_files(ip, timeout):
+    response = requests.get(f"http://{ip}/edit", params={"list": "/"}, timeout=timeout)
+    response.raise_for_status()
+    return {normalize_remote_path(entry["name"]): entry.get("size", 0)
+            for entry in response.json() if entry.get("type", "file") == "file"}
+
+def remote_sha256(ip, remote_path, timeout):
+    response = requests.get(f"http://{ip}/edit", params={"edit": remote_path}, timeout=timeout)
+    response.raise_for_status()
+    return hashlib.sha256(response.content).hexdigest()
+
+def sync_device(ip, entries, delete=False, size_only=False, dry_run=False, timeout=10):
+    """Upload missing or changed files to one device and optionally delete stale ones."""
+    prefix = "[dry run] " if dry_run else ""
+    try:
+        remote_files = list_remote_files(ip, timeout)
+
+        changed = []
+        for remote_path, local_file in entries.items():
+            remote_size = remote_files.get(remote_path)
+            if remote_size is None or remote_size != local_file.size:
+                changed.append(remote_path)
+            elif not size_only and remote_sha256(ip, remote_path, timeout) != local_file.sha256:
+                changed.append(remote_path)
+
+        stale = []
+        if delete:
+            stale = [path for path in remote_files if path not in entries and path not in PROTECTED_FILES]
+
+        # Files being replaced free their current size, so only the growth has to fit
+        status = get_cached_status(ip)
+        if status is not None and status.reachable and status.info.get("fs"):
+            needed_kb = sum(entries[path].size - remote_files.get(path, 0) for path in changed) / 1024
+            freed_kb = sum(remote_files[path] for path in stale) / 1024
+            if needed_kb - freed_kb > status.fs_free_kb:
+                print(f"✗ {ip}: not enough filesystem space ({needed_kb - freed_kb:.0f} kB needed, "
+                      f"{status.fs_free_kb} kB free)")
+                return False
+
+        for remote_path in changed:
+            local_file = entries[remote_path]
+            print(f"  {prefix}{ip}: upload {local_file.path} -> {remote_path} ({local_file.size} B)")
+            if not dry_run:
+                response = requests.post(f"http://{ip}/edit",
+                                         files={"data": (remote_path, local_file.data)},
+                                         timeout=timeout)
+                response.raise_for_status()
+
+        for remote_path in stale:
+            print(f"  {prefix}{ip}: delete {remote_path}")
+            if not dry_run:
+                response = requests.delete(f"http://{ip}/edit", data={"path": remote_path}, timeout=timeout)
+                response.raise_for_status()
+
+        skipped = len(entries) - len(changed)
+        print(f"✓ {prefix}{ip}: {len(changed)} uploaded, {skipped} unchanged, {len(stale)} deleted")
+        return True
+
+    except requests.exceptions.Timeout:
+        print(f"✗ Timeout error connecting to {ip} (device may be offline or slow)")
+        return False
+    except requests.exceptions.ConnectionError:
+        print(f"✗ Connection error to {ip} (device may be offline or unreachable)")
+        return False
+    except requests.exceptions.HTTPError as e:
+        print(f"✗ HTTP error from {ip}: {e.response.status_code} - {e.response.reason}")
+        return False
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Request error to {ip}: {e}")
+        return False
+    except ValueError as e:
+        print(f"✗ Invalid file listing from {ip}: {e}")
+        return False
+    except Exception as e:
+        print(f"✗ Unexpected error syncing {ip}: {e}")
+        return False
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync files (presets, ledmap, palettes, cfg.json) to WLED devices from a manifest.")
+    parser.add_argument("manifest_file", help="JSON manifest mapping selectors to {local file: device path}.")
+    add_target_arguments(parser)
+    parser.add_argument("--delete", action="store_true", help="Delete device files not in the manifest (cfg.json, wsec.json and presets.json are kept).")
+    parser.add_argument("--size-only", action="store_true", help="Compare files by size only, without downloading them to compare hashes.")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be uploaded or deleted without changing anything.")
+    add_preflight_arguments(parser)
+    parser.add_argument("--workers", type=int, default=8, help="Number of devices to sync at the same time.")
+    args = parser.parse_args()
+
+    try:
+        inventory = load_inventory(args.inventory, args.groups)
+        plan = load_manifest(args.manifest_file, inventory)
+    except (OSError, ValueError) as e:
+        print(f"✗ Invalid manifest: {e}")
+        exit(1)
+
+    # --target-ip / --select narrow the manifest down to a subset of its devices
+    if args.target_ip or args.select:
+        wanted = resolve_target_ips(args, inventory)
+        for ip in wanted:
+            if ip not in plan:
+                print(f"✗ {ip}: requested but has no entry in {args.manifest_file}, skipping")
+        plan = {ip: plan[ip] for ip in wanted if ip in plan}
+        if not plan:
+            print("None of the requested targets are in the manifest.")
+            exit(1)
+
+    if not plan:
+        print(f"No devices to sync: {args.manifest_file} matches no device in the inventory.")
+        exit(1)
+
+    successful_syncs = 0
+    failed_syncs = 0
+    target_ips = list(plan)
+
+    if not args.skip_preflight:
+        target_ips, excluded = run_preflight(target_ips, connect_timeout=args.preflight_timeout, min_vid=args.min_vid)
+        failed_syncs += len(excluded)
+
+    print(f"\nSyncing {len(target_ips)} device(s)...")
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(sync_device, ip, plan[ip], args.delete, args.size_only, args.dry_run)
+                   for ip in target_ips]
+        for future in as_completed(futures):
+            if future.result():
+                successful_syncs += 1
+            else:
+                failed_syncs += 1
+
+    # Print summary
+    total_devices = successful_syncs + failed_syncs
+    print(f"\n{'='*50}")
+    print(f"Sync Summary:")
+    print(f"  Total devices: {total_devices}")
+    print(f"  Successful: {successful_syncs}")
+    print(f"  Failed: {failed_syncs}")
+
+    if failed_syncs > 0:
+        print(f"  Success rate: {(successful_syncs/total_devices)*100:.1f}%")
+        exit(1)
+    else:
+        print(f"  All syncs completed successfully!")
+        print("\nReboot devices that received cfg.json for it to take effect.")
+        exit(0)
+
+if __name__ == "__main__":
+    main()
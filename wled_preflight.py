@@ -0,0 +1,128 @@
+import socket
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Results of the pre-flight sweep, keyed by IP. Filled once per run so the
+# main phase can reuse device info without hitting /json/info again.
+_status_cache = {}
+
+class DeviceStatus:
+    def __init__(self, ip, port=80):
+        self.ip = ip
+        self.port = port
+        self.reachable = False
+        self.info = {}
+        self.reason = None
+
+    @property
+    def name(self):
+        return self.info.get("name", "Unknown device")
+
+    @property
+    def mac(self):
+        return self.info.get("mac", "Unknown MAC address")
+
+    @property
+    def version(self):
+        return self.info.get("ver", "unknown")
+
+    @property
+    def vid(self):
+        return self.info.get("vid", 0)
+
+    @property
+    def led_count(self):
+        return self.info.get("leds", {}).get("count", 0)
+
+    @property
+    def free_heap(self):
+        return self.info.get("freeheap", 0)
+
+    @property
+    def fs_free_kb(self):
+        fs = self.info.get("fs", {})
+        return fs.get("t", 0) - fs.get("u", 0)
+
+    @property
+    def ok(self):
+        return self.reachable and self.reason is None
+
+def tcp_probe(ip, port=80, timeout=1.0):
+    """Return True if a TCP connection to ip:port opens within timeout."""
+    try:
+        with socket.create_connection((ip, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def check_device(ip, port=80, connect_timeout=1.0, info_timeout=3.0, min_vid=None):
+    """Probe a device and fetch /json/info once, recording why it was excluded if it was."""
+    status = DeviceStatus(ip, port)
+
+    if not tcp_probe(ip, port, connect_timeout):
+        status.reason = f"no TCP connection on port {port} within {connect_timeout}s"
+        return status
+
+    try:
+        response = requests.get(f"http://{ip}:{port}/json/info", timeout=info_timeout)
+        response.raise_for_status()
+        info = response.json()
+    except requests.exceptions.RequestException as e:
+        status.reason = f"/json/info request failed: {e}"
+        return status
+    except ValueError as e:
+        status.reason = f"invalid JSON from /json/info: {e}"
+        return status
+
+    if not isinstance(info, dict):
+        status.reason = f"unexpected /json/info response (expected an object, got {type(info).__name__})"
+        return status
+    status.info = info
+    status.reachable = True
+
+    if min_vid is not None and status.vid < min_vid:
+        status.reason = f"firmware {status.version} (vid {status.vid}) is older than required vid {min_vid}"
+
+    return status
+
+def run_preflight(ips, port=80, connect_timeout=1.0, info_timeout=3.0, min_vid=None, max_workers=32, ports=None):
+    """
+    Check all target IPs concurrently and cache the results for the rest of the run.
+    ports optionally maps an IP to the port to probe instead of the default port.
+    Returns (ready_ips, excluded_statuses), with ready_ips in the original order.
+    """
+    ports = ports or {}
+    unique_ips = list(dict.fromkeys(ips))
+    print(f"Pre-flight check of {len(unique_ips)} device(s)...")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(check_device, ip, ports.get(ip, port), connect_timeout, info_timeout, min_vid)
+                   for ip in unique_ips]
+        for future in as_completed(futures):
+            status = future.result()
+            _status_cache[status.ip] = status
+
+    ready = []
+    excluded = []
+    for ip in unique_ips:
+        status = _status_cache[ip]
+        if status.ok:
+            print(f"  ✓ {ip}: {status.name} v{status.version} (vid {status.vid}), "
+                  f"{status.led_count} LEDs, heap {status.free_heap} B, fs free {status.fs_free_kb} kB")
+            ready.append(ip)
+        else:
+            print(f"  ✗ {ip}: excluded - {status.reason}")
+            excluded.append(status)
+
+    print(f"Pre-flight: {len(ready)} ready, {len(excluded)} excluded")
+    return ready, excluded
+
+def get_cached_status(ip):
+    """Return the pre-flight status for ip, or None if it was not checked this run."""
+    return _status_cache.get(ip)
+
+def add_preflight_arguments(parser):
+    """Add the pre-flight options shared by the fleet scripts."""
+    parser.add_argument("--min-vid", type=int, help="Skip devices whose firmware build (vid) is older than this (ex: 2403170).")
+    parser.add_argument("--preflight-timeout", type=float, default=1.0, help="TCP connect timeout in seconds for the pre-flight check.")
+    parser.add_argument("--skip-preflight", action="store_true", help="Do not check reachability and firmware before the main phase.")
@@ -0,0 +1,212 @@
+import csv
+import json
+import ipaddress
+import os
+import re
+from fnmatch import fnmatchcase
+
+DEFAULT_INVENTORY = "wled.csv"
+DEFAULT_GROUPS = "groups.json"
+
+SELECTOR_KEYS = ("name", "ip", "mac", "subnet", "tag", "group")
+
+class InventoryDevice:
+    def __init__(self, name, ip, network=None, mac=None, tags=None):
+        self.name = name
+        self.ip = ip
+        self.network = network
+        self.mac = mac
+        self.tags = tags or []
+
+def normalize_mac(mac):
+    return re.sub(r"[^0-9a-f]", "", mac.lower())
+
+class Inventory:
+    """Devices from the inventory CSV, indexed by name, IP, MAC, tag and group."""
+
+    def __init__(self, devices, groups=None):
+        self.devices = devices
+        self.by_name = {}
+        self.by_ip = {}
+        self.by_mac = {}
+        self.by_tag = {}
+        self.by_group = {}
+
+        for device in devices:
+            self.by_name[device.name.lower()] = device
+            self.by_ip[device.ip] = device
+            if device.mac:
+                self.by_mac[normalize_mac(device.mac)] = device
+            for tag in device.tags:
+                self.by_tag.setdefault(tag.lower(), set()).add(device.name)
+
+        for group, members in (groups or {}).items():
+            names = set()
+            for member in members:
+                device = self.by_name.get(member.lower()) or self.by_ip.get(member)
+                if device is None:
+                    raise ValueError(f"Group '{group}' references unknown device '{member}'")
+                names.add(device.name)
+            self.by_group[group.lower()] = names
+
+    def all_names(self):
+        return {device.name for device in self.devices}
+
+    def match(self, key, value):
+        """Return the set of device names where key matches value."""
+        value_lower = value.lower()
+        if key == "name":
+            if any(c in value for c in "*?["):
+                return {d.name for d in self.devices if fnmatchcase(d.name.lower(), value_lower)}
+            device = self.by_name.get(value_lower)
+            return {device.name} if device else set()
+        if key == "ip":
+            if any(c in value for c in "*?["):
+                return {d.name for d in self.devices if fnmatchcase(d.ip, value)}
+            device = self.by_ip.get(value)
+            return {device.name} if device else set()
+        if key == "mac":
+            device = self.by_mac.get(normalize_mac(value))
+            return {device.name} if device else set()
+        if key == "subnet":
+            try:
+                network = ipaddress.ip_network(value, strict=False)
+            except ValueError:
+                raise ValueError(f"Invalid subnet '{value}'")
+            return {d.name for d in self.devices if ipaddress.ip_address(d.ip) in network}
+        if key == "tag":
+            return set(self.by_tag.get(value_lower, ()))
+        if key == "group":
+            if value_lower not in self.by_group:
+                raise ValueError(f"Unknown group '{value}'")
+            return set(self.by_group[value_lower])
+        raise ValueError(f"Unknown selector key '{key}' (expected one of: {', '.join(SELECTOR_KEYS)})")
+
+    def resolve(self, expression):
+        """Return the devices matching a selector expression, in inventory order."""
+        names = SelectorParser(expression, self).parse()
+        return [device for device in self.devices if device.name in names]
+
+def load_inventory(csv_file=DEFAULT_INVENTORY, groups_file=DEFAULT_GROUPS):
+    """
+    Load the device inventory. Each row is: name, ip[/prefix], optional MAC, optional tags
+    (separated by ';' or spaces). Rows may be tab or comma separated, so both wled.csv and
+    the logfile written by wled-config.py can be used.
+    """
+    devices = []
+    with open(csv_file, mode='r', newline='') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            delimiter = '\t' if '\t' in line else ','
+            row = [field.strip() for field in next(csv.reader([line], delimiter=delimiter))]
+            if len(row) < 2 or not row[1]:
+                continue
+            address, _, prefix = row[1].partition('/')
+            network = ipaddress.ip_network(f"{address}/{prefix}", strict=False) if prefix else None
+            mac = row[2] if len(row) > 2 and row[2] else None
+            tags = re.split(r"[;\s]+", row[3]) if len(row) > 3 and row[3] else []
+            devices.append(InventoryDevice(row[0], address, network, mac, tags))
+
+    groups = {}
+    if groups_file and os.path.exists(groups_file):
+        with open(groups_file, mode='r') as file:
+            groups = json.load(file)
+
+    return Inventory(devices, groups)
+
+_TOKEN_RE = re.compile(r"\s*(\(|\)|[A-Za-z]+\s*=\s*[^\s()]+|[^\s()]+)")
+
+class SelectorParser:
+    """
+    Parse expressions such as 'group=stations and not name=WLED-117'.
+    Grammar: or-expr := and-expr ('or' and-expr)*, and-expr := unary ('and' unary)*,
+    unary := 'not' unary | '(' or-expr ')' | key=value.
+    """
+
+    def __init__(self, expression, inventory):
+        self.inventory = inventory
+        self.tokens = []
+        position = 0
+        expression = expression.strip()
+        while position < len(expression):
+            match = _TOKEN_RE.match(expression, position)
+            if not match:
+                raise ValueError(f"Invalid selector near '{expression[position:]}'")
+            self.tokens.append(match.group(1))
+            position = match.end()
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Empty selector")
+        result = self.parse_or()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected '{self.peek()}' in selector")
+        return result
+
+    def parse_or(self):
+        result = self.parse_and()
+        while self.peek() is not None and self.peek().lower() == "or":
+            self.take()
+            result = result | self.parse_and()
+        return result
+
+    def parse_and(self):
+        result = self.parse_unary()
+        while self.peek() is not None and self.peek().lower() == "and":
+            self.take()
+            result = result & self.parse_unary()
+        return result
+
+    def parse_unary(self):
+        token = self.take()
+        if token is None:
+            raise ValueError("Selector ends unexpectedly")
+        if token.lower() == "not":
+            return self.inventory.all_names() - self.parse_unary()
+        if token == "(":
+            result = self.parse_or()
+            if self.take() != ")":
+                raise ValueError("Missing ')' in selector")
+            return result
+        if "=" not in token:
+            raise ValueError(f"Expected key=value in selector, got '{token}'")
+        key, _, value = token.partition("=")
+        return self.inventory.match(key.strip().lower(), value.strip())
+
+def add_target_arguments(parser):
+    """Add the target selection options shared by the fleet scripts."""
+    parser.add_argument('--target-ip', type=str, help='Comma separated list of target IPs (ex: 192.168.1.10,192.168.1.11)')
+    parser.add_argument("--select", help="Select targets from the inventory (ex: \"group=stations and not name=WLED-117\").")
+    parser.add_argument("--inventory", default=DEFAULT_INVENTORY, help=f"Inventory CSV used by --select (default: {DEFAULT_INVENTORY}).")
+    parser.add_argument("--groups", default=DEFAULT_GROUPS, help=f"JSON file mapping group names to devices (default: {DEFAULT_GROUPS}).")
+
+def resolve_target_ips(args, inventory=None):
+    """
+    Return the IPs given by --target-ip and --select, without duplicates.
+    An already loaded inventory can be passed to avoid reading it again.
+    """
+    target_ips = []
+    if args.target_ip:
+        target_ips.extend(ip.strip() for ip in args.target_ip.split(',') if ip.strip())
+    if args.select:
+        try:
+            if inventory is None:
+                inventory = load_inventory(args.inventory, args.groups)
+            devices = inventory.resolve(args.select)
+        except (OSError, ValueError) as e:
+            print(f"✗ Invalid target selection: {e}")
+            exit(1)
+        print(f"Selector '{args.select}' matched {len(devices)} device(s)")
+        target_ips.extend(device.ip for device in devices)
+    return list(dict.fromkeys(target_ips))